@@ -5,15 +5,15 @@ A modular cybersecurity assessment platform for evaluating incident response rea
 """
 
 import os
+import re
 import sys
-import json
-import yaml
+import time
+from bisect import bisect_right
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 from enum import Enum
-import re
+from functools import lru_cache, wraps
 
 
 # ============================================================================
@@ -50,11 +50,54 @@ class ReadinessLevel(Enum):
     EXCELLENT = "Excellent"
 
 
+# Prebuilt message prefixes and header bars
+_SUCCESS_PREFIX = f"{Color.GREEN}✓{Color.RESET} "
+_WARNING_PREFIX = f"{Color.YELLOW}⚠{Color.RESET} "
+_ERROR_PREFIX = f"{Color.RED}✗{Color.RESET} "
+_INFO_PREFIX = f"{Color.BLUE}ℹ{Color.RESET} "
+_HEADER_BAR = f"{Color.CYAN}{Color.BOLD}{'='*60}{Color.RESET}"
+
+# Prompt tails for get_yes_no, keyed by default answer
+_YES_NO_SUFFIXES = {
+    True: f" (Y/n){Color.RESET} [{Color.DIM}y{Color.RESET}]: ",
+    False: f" (y/N){Color.RESET} [{Color.DIM}n{Color.RESET}]: ",
+}
+_YES_ANSWERS = frozenset(('y', 'yes', '1', 'true'))
+
+# Write buffer for exported report files
+_EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Separator for comma-separated answers, swallowing surrounding whitespace
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+# Slotted dataclasses (no per-instance __dict__) require Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Every possible progress bar state, indexed by filled cell count
+_PROGRESS_BAR_LENGTH = 40
+_PROGRESS_BARS = tuple(
+    '█' * filled + '░' * (_PROGRESS_BAR_LENGTH - filled)
+    for filled in range(_PROGRESS_BAR_LENGTH + 1)
+)
+
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+_now_iso_cache = {'checked': 0.0, 'value': ''}
+
+
+def _now_iso() -> str:
+    """Current time as ISO string, refreshed at most once per second"""
+    now = time.monotonic()
+    if not _now_iso_cache['value'] or now - _now_iso_cache['checked'] >= 1.0:
+        _now_iso_cache['value'] = datetime.now().isoformat()
+        _now_iso_cache['checked'] = now
+    return _now_iso_cache['value']
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class EnvironmentProfile:
     """Organization environment metadata"""
     org_name: str
@@ -64,14 +107,10 @@ class EnvironmentProfile:
     security_tools: List[str]
     log_sources: List[str]
     retention_days: int
-    timestamp: str = None
-    
-    def __post_init__(self):
-        if not self.timestamp:
-            self.timestamp = datetime.now().isoformat()
+    timestamp: str = field(default_factory=_now_iso)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LogAnalysisResult:
     """Results from log availability and quality analysis"""
     source_name: str
@@ -84,7 +123,7 @@ class LogAnalysisResult:
     recommendations: List[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PlaybookAnalysisResult:
     """Results from playbook evaluation"""
     playbook_name: str
@@ -97,7 +136,7 @@ class PlaybookAnalysisResult:
     recommendations: List[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ReadinessAssessment:
     """Overall incident response readiness assessment"""
     overall_score: float
@@ -110,25 +149,16 @@ class ReadinessAssessment:
     high_priority_gaps: List[str]
     medium_priority_gaps: List[str]
     recommendations: List[str]
-    timestamp: str = None
-    
-    def __post_init__(self):
-        if not self.timestamp:
-            self.timestamp = datetime.now().isoformat()
+    timestamp: str = field(default_factory=_now_iso)
 
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def clear_screen():
-    """Clear terminal screen cross-platform"""
-    os.system('cls' if os.name == 'nt' else 'clear')
-
+_CLEAR_SCREEN = '\x1b[2J\x1b[H'
 
-def print_banner():
-    """Display professional ASCII banner"""
-    banner = f"""
+_BANNER = f"""
 {Color.CYAN}{Color.BOLD}
 ██╗██████╗ ██████╗ 
 ██║██╔══██╗██╔══██╗
@@ -141,34 +171,91 @@ def print_banner():
 {Color.DIM}Professional Security Assessment Platform v1.0{Color.RESET}
 {Color.DIM}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Color.RESET}
 """
-    print(banner)
+
+
+def _enable_ansi_console() -> bool:
+    """Turn on ANSI escape handling for the console, True when it is available"""
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING, rejected by consoles before Windows 10
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
+# Enabled once at import; Python never turns on escape handling by itself
+_ANSI_CONSOLE = _enable_ansi_console()
+
+
+def clear_screen():
+    """Clear terminal screen cross-platform"""
+    sys.stdout.write(_CLEAR_SCREEN)
+    sys.stdout.flush()
+
+
+if not _ANSI_CONSOLE:
+    def clear_screen():
+        """Clear terminal screen via the shell when ANSI escapes are unavailable"""
+        os.system('cls')
+
+
+def print_banner():
+    """Display professional ASCII banner"""
+    print(_BANNER)
+
+
+def show_banner_screen():
+    """Clear terminal screen and display banner in a single write"""
+    sys.stdout.write(_CLEAR_SCREEN + _BANNER + "\n")
+    sys.stdout.flush()
+
+
+if not _ANSI_CONSOLE:
+    def show_banner_screen():
+        """Clear terminal screen and display banner when ANSI escapes are unavailable"""
+        clear_screen()
+        print_banner()
 
 
 def print_section_header(title: str):
     """Print formatted section header"""
-    print(f"\n{Color.CYAN}{Color.BOLD}{'='*60}{Color.RESET}")
-    print(f"{Color.CYAN}{Color.BOLD}{title.center(60)}{Color.RESET}")
-    print(f"{Color.CYAN}{Color.BOLD}{'='*60}{Color.RESET}\n")
+    BOLD, RESET, CYAN = Color.BOLD, Color.RESET, Color.CYAN
+    print(f"\n{_HEADER_BAR}")
+    print(f"{CYAN}{BOLD}{title.center(60)}{RESET}")
+    print(f"{_HEADER_BAR}\n")
 
 
 def print_success(message: str):
     """Print success message"""
-    print(f"{Color.GREEN}✓{Color.RESET} {message}")
+    print(_SUCCESS_PREFIX + message)
 
 
 def print_warning(message: str):
     """Print warning message"""
-    print(f"{Color.YELLOW}⚠{Color.RESET} {message}")
+    print(_WARNING_PREFIX + message)
 
 
 def print_error(message: str):
     """Print error message"""
-    print(f"{Color.RED}✗{Color.RESET} {message}")
+    print(_ERROR_PREFIX + message)
 
 
 def print_info(message: str):
     """Print info message"""
-    print(f"{Color.BLUE}ℹ{Color.RESET} {message}")
+    print(_INFO_PREFIX + message)
+
+
+def print_lines(lines: List[str]):
+    """Print a block of lines with a single write"""
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
 
 
 def get_input(prompt: str, default: str = None) -> str:
@@ -182,22 +269,34 @@ def get_input(prompt: str, default: str = None) -> str:
     return value if value else default
 
 
-def get_yes_no(prompt: str, default: bool = True) -> bool:
-    """Get yes/no confirmation from user"""
-    default_str = "Y/n" if default else "y/N"
-    response = get_input(f"{prompt} ({default_str})", "y" if default else "n").lower()
-    return response in ['y', 'yes', '1', 'true'] if response else default
+def get_yes_no(prompt: str, default: bool = True, prompt_suffix: str = None) -> bool:
+    """Get yes/no confirmation from user (prompt_suffix overrides the default tail)"""
+    suffix = prompt_suffix or _YES_NO_SUFFIXES[default]
+    response = input("".join((Color.WHITE, prompt, suffix))).strip().lower()
+    return response in _YES_ANSWERS if response else default
+
+
+def parse_csv(value: str) -> List[str]:
+    """Split comma-separated input into trimmed, non-empty items"""
+    return [item for item in _CSV_SPLIT.split(value.strip()) if item]
+
+
+def pause(message: str = "Press Enter to continue..."):
+    """Wait for Enter on an interactive terminal, skip when input is piped"""
+    if sys.stdin.isatty():
+        input(f"\n{Color.DIM}{message}{Color.RESET}")
 
 
 def display_menu(title: str, options: List[str]) -> int:
     """Display menu and get user selection"""
-    print(f"\n{Color.BOLD}{title}{Color.RESET}")
-    print(f"{Color.DIM}{'─'*60}{Color.RESET}")
+    BOLD, DIM, RESET, CYAN = Color.BOLD, Color.DIM, Color.RESET, Color.CYAN
+    print(f"\n{BOLD}{title}{RESET}")
+    print(f"{DIM}{'─'*60}{RESET}")
     
     for i, option in enumerate(options, 1):
-        print(f"  {Color.CYAN}{i}.{Color.RESET} {option}")
+        print(f"  {CYAN}{i}.{RESET} {option}")
     
-    print(f"  {Color.CYAN}0.{Color.RESET} {Color.DIM}Exit{Color.RESET}")
+    print(f"  {CYAN}0.{RESET} {DIM}Exit{RESET}")
     print()
     
     while True:
@@ -212,10 +311,8 @@ def display_menu(title: str, options: List[str]) -> int:
 
 def display_progress_bar(current: int, total: int, prefix: str = "Progress"):
     """Display progress bar"""
-    bar_length = 40
-    filled = int(bar_length * current / total)
-    bar = '█' * filled + '░' * (bar_length - filled)
-    percent = int(100 * current / total)
+    bar = _PROGRESS_BARS[_PROGRESS_BAR_LENGTH * current // total]
+    percent = 100 * current // total
     
     print(f"\r{prefix}: {Color.CYAN}[{bar}]{Color.RESET} {percent}%", end='', flush=True)
     
@@ -223,6 +320,41 @@ def display_progress_bar(current: int, total: int, prefix: str = "Progress"):
         print()
 
 
+@lru_cache(maxsize=256)
+def _colored_percentage(percentage: int, color: str) -> str:
+    """Build colored percentage string (memoized, percentages are small ints)"""
+    return f"{color}{percentage}%{Color.RESET}"
+
+
+def score_to_color(score: float, thresholds: tuple) -> str:
+    """Convert score to colored display using (green, yellow) score thresholds"""
+    green_threshold, yellow_threshold = thresholds
+    if score >= green_threshold:
+        color = Color.GREEN
+    elif score >= yellow_threshold:
+        color = Color.YELLOW
+    else:
+        color = Color.RED
+    return _colored_percentage(int(score * 100), color)
+
+
+def memoize_on_results(method):
+    """Cache a score derived from self.results until the list is replaced or resized"""
+    cache_attr = f"_{method.__name__}_cache"
+    
+    @wraps(method)
+    def wrapper(self):
+        results = self.results
+        cached = self.__dict__.get(cache_attr)
+        if cached and cached[0] is results and cached[1] == len(results):
+            return cached[2]
+        value = method(self)
+        self.__dict__[cache_attr] = (results, len(results), value)
+        return value
+    
+    return wrapper
+
+
 # ============================================================================
 # MODULE: ENVIRONMENT OVERVIEW
 # ============================================================================
@@ -244,21 +376,21 @@ class EnvironmentModule:
         
         print(f"\n{Color.BOLD}Platform Coverage:{Color.RESET}")
         print(f"{Color.DIM}Enter platforms (comma-separated): Windows, Linux, macOS, Cloud, etc.{Color.RESET}")
-        platforms = [p.strip() for p in get_input("Platforms", "Windows,Linux").split(',')]
+        platforms = parse_csv(get_input("Platforms", "Windows,Linux"))
         
         endpoints_count = int(get_input("Approximate endpoint count", "100"))
         
         print(f"\n{Color.BOLD}Network Architecture:{Color.RESET}")
         print(f"{Color.DIM}Enter network segments (comma-separated): DMZ, Internal, Management, etc.{Color.RESET}")
-        network_segments = [s.strip() for s in get_input("Network segments", "DMZ,Internal").split(',')]
+        network_segments = parse_csv(get_input("Network segments", "DMZ,Internal"))
         
         print(f"\n{Color.BOLD}Security Tools:{Color.RESET}")
         print(f"{Color.DIM}Enter security tools (comma-separated): EDR, SIEM, Firewall, etc.{Color.RESET}")
-        security_tools = [t.strip() for t in get_input("Security tools", "EDR,SIEM,Firewall").split(',')]
+        security_tools = parse_csv(get_input("Security tools", "EDR,SIEM,Firewall"))
         
         print(f"\n{Color.BOLD}Log Sources:{Color.RESET}")
         print(f"{Color.DIM}Enter log sources (comma-separated): Windows Event Logs, Syslog, Application Logs, etc.{Color.RESET}")
-        log_sources = [l.strip() for l in get_input("Log sources", "Windows Event Logs,Syslog").split(',')]
+        log_sources = parse_csv(get_input("Log sources", "Windows Event Logs,Syslog"))
         
         retention_days = int(get_input("Log retention period (days)", "90"))
         
@@ -283,25 +415,26 @@ class EnvironmentModule:
         
         print_section_header("ENVIRONMENT SUMMARY")
         
-        print(f"{Color.BOLD}Organization:{Color.RESET} {self.profile.org_name}")
-        print(f"{Color.BOLD}Endpoints:{Color.RESET} {self.profile.endpoints_count:,}")
-        print(f"{Color.BOLD}Log Retention:{Color.RESET} {self.profile.retention_days} days")
+        BOLD, RESET = Color.BOLD, Color.RESET
+        lines = [
+            f"{BOLD}Organization:{RESET} {self.profile.org_name}",
+            f"{BOLD}Endpoints:{RESET} {self.profile.endpoints_count:,}",
+            f"{BOLD}Log Retention:{RESET} {self.profile.retention_days} days",
+        ]
         
-        print(f"\n{Color.BOLD}Platforms:{Color.RESET}")
-        for platform in self.profile.platforms:
-            print(f"  • {platform}")
+        lines.append(f"\n{BOLD}Platforms:{RESET}")
+        lines.extend(f"  • {platform}" for platform in self.profile.platforms)
         
-        print(f"\n{Color.BOLD}Network Segments:{Color.RESET}")
-        for segment in self.profile.network_segments:
-            print(f"  • {segment}")
+        lines.append(f"\n{BOLD}Network Segments:{RESET}")
+        lines.extend(f"  • {segment}" for segment in self.profile.network_segments)
         
-        print(f"\n{Color.BOLD}Security Tools:{Color.RESET}")
-        for tool in self.profile.security_tools:
-            print(f"  • {tool}")
+        lines.append(f"\n{BOLD}Security Tools:{RESET}")
+        lines.extend(f"  • {tool}" for tool in self.profile.security_tools)
         
-        print(f"\n{Color.BOLD}Log Sources:{Color.RESET}")
-        for source in self.profile.log_sources:
-            print(f"  • {source}")
+        lines.append(f"\n{BOLD}Log Sources:{RESET}")
+        lines.extend(f"  • {source}" for source in self.profile.log_sources)
+        
+        print_lines(lines)
 
 
 # ============================================================================
@@ -311,6 +444,16 @@ class EnvironmentModule:
 class LogAnalysisModule:
     """Module for analyzing log availability, quality, and completeness"""
     
+    SCORE_THRESHOLDS = (0.9, 0.75)
+    
+    # Lowercase source-name keyword -> classification tag
+    SOURCE_TAGS = {
+        'windows': 'time_synced',
+        'syslog': 'time_synced',
+        'application': 'incomplete',
+        'custom': 'incomplete',
+    }
+    
     def __init__(self, environment: EnvironmentModule):
         self.environment = environment
         self.results: List[LogAnalysisResult] = []
@@ -347,6 +490,10 @@ class LogAnalysisModule:
         # Determine availability based on source type
         available = True
         
+        # Classify source once against the keyword table
+        lowered = source.lower()
+        tags = {tag for keyword, tag in self.SOURCE_TAGS.items() if keyword in lowered}
+        
         # Check retention compliance
         retention_compliance = self.environment.profile.retention_days >= 90
         if not retention_compliance:
@@ -354,7 +501,7 @@ class LogAnalysisModule:
             recommendations.append("Increase log retention to at least 90 days")
         
         # Analyze timestamp consistency (simulated scoring)
-        timestamp_consistency = 0.85 if "Windows" in source or "Syslog" in source else 0.75
+        timestamp_consistency = 0.85 if 'time_synced' in tags else 0.75
         if timestamp_consistency < 0.9:
             issues.append("Potential timestamp synchronization issues detected")
             recommendations.append("Implement NTP synchronization across all log sources")
@@ -363,7 +510,7 @@ class LogAnalysisModule:
         volume_score = 0.80
         completeness_score = 0.75
         
-        if "Application" in source or "Custom" in source:
+        if 'incomplete' in tags:
             completeness_score = 0.65
             issues.append("Application logs may lack critical security events")
             recommendations.append("Enhance application logging to include authentication and authorization events")
@@ -381,42 +528,34 @@ class LogAnalysisModule:
     
     def _display_analysis_results(self):
         """Display log analysis results"""
-        print(f"{Color.BOLD}Log Analysis Results:{Color.RESET}\n")
+        BOLD, RESET, RED, GREEN, YELLOW = Color.BOLD, Color.RESET, Color.RED, Color.GREEN, Color.YELLOW
+        lines = [f"{BOLD}Log Analysis Results:{RESET}\n"]
         
         for result in self.results:
-            status = f"{Color.GREEN}✓ Available{Color.RESET}" if result.available else f"{Color.RED}✗ Unavailable{Color.RESET}"
-            print(f"{Color.BOLD}{result.source_name}{Color.RESET} - {status}")
-            print(f"  Timestamp Consistency: {self._score_to_color(result.timestamp_consistency)}")
-            print(f"  Volume Score: {self._score_to_color(result.volume_score)}")
-            print(f"  Completeness: {self._score_to_color(result.completeness_score)}")
+            status = f"{GREEN}✓ Available{RESET}" if result.available else f"{RED}✗ Unavailable{RESET}"
+            lines.append(f"{BOLD}{result.source_name}{RESET} - {status}")
+            lines.append(f"  Timestamp Consistency: {score_to_color(result.timestamp_consistency, self.SCORE_THRESHOLDS)}")
+            lines.append(f"  Volume Score: {score_to_color(result.volume_score, self.SCORE_THRESHOLDS)}")
+            lines.append(f"  Completeness: {score_to_color(result.completeness_score, self.SCORE_THRESHOLDS)}")
             
             if result.issues:
-                print(f"  {Color.YELLOW}Issues:{Color.RESET}")
-                for issue in result.issues:
-                    print(f"    • {issue}")
-            print()
-    
-    def _score_to_color(self, score: float) -> str:
-        """Convert score to colored display"""
-        percentage = int(score * 100)
-        if score >= 0.9:
-            color = Color.GREEN
-        elif score >= 0.75:
-            color = Color.YELLOW
-        else:
-            color = Color.RED
-        return f"{color}{percentage}%{Color.RESET}"
+                lines.append(f"  {YELLOW}Issues:{RESET}")
+                lines.extend(f"    • {issue}" for issue in result.issues)
+            lines.append("")
+        
+        print_lines(lines)
     
+    @memoize_on_results
     def get_evidence_availability_score(self) -> float:
         """Calculate overall evidence availability score"""
         if not self.results:
             return 0.0
         
-        scores = [
+        total = sum(
             (r.timestamp_consistency + r.volume_score + r.completeness_score) / 3
             for r in self.results
-        ]
-        return sum(scores) / len(scores)
+        )
+        return total / len(self.results)
 
 
 # ============================================================================
@@ -426,6 +565,42 @@ class LogAnalysisModule:
 class PlaybookModule:
     """Module for evaluating incident response playbooks"""
     
+    SCORE_THRESHOLDS = (0.8, 0.65)
+    
+    # Findings and score deltas applied when a playbook name contains a keyword
+    ADJUSTMENTS = (
+        {
+            'keywords': ('malware', 'ransomware'),
+            'ambiguous_steps': ["Step 5: 'Contain the threat' lacks specific isolation procedures"],
+            'missing_elements': ["No guidance on encrypted backup restoration"],
+            'unrealistic_assumptions': [],
+            'recommendations': ["Add detailed network isolation procedures with specific commands"],
+            'clarity': -0.05,
+            'feasibility': 0.0,
+            'completeness': -0.08,
+        },
+        {
+            'keywords': ('phishing',),
+            'ambiguous_steps': ["Step 3: 'Analyze email headers' assumes technical expertise"],
+            'missing_elements': ["Missing user communication templates"],
+            'unrealistic_assumptions': [],
+            'recommendations': ["Include step-by-step header analysis guide with examples"],
+            'clarity': -0.10,
+            'feasibility': 0.0,
+            'completeness': 0.0,
+        },
+        {
+            'keywords': ('data breach',),
+            'ambiguous_steps': [],
+            'missing_elements': ["Legal and regulatory notification procedures undefined"],
+            'unrealistic_assumptions': ["Assumes full network visibility and logging"],
+            'recommendations': ["Develop breach notification checklist with timelines"],
+            'clarity': 0.0,
+            'feasibility': -0.15,
+            'completeness': -0.12,
+        },
+    )
+    
     def __init__(self):
         self.results: List[PlaybookAnalysisResult] = []
     
@@ -487,25 +662,17 @@ class PlaybookModule:
         completeness_score = 0.72
         
         # Identify common issues
-        if "Malware" in playbook_name or "Ransomware" in playbook_name:
-            ambiguous_steps.append("Step 5: 'Contain the threat' lacks specific isolation procedures")
-            missing_elements.append("No guidance on encrypted backup restoration")
-            recommendations.append("Add detailed network isolation procedures with specific commands")
-            clarity_score -= 0.05
-            completeness_score -= 0.08
-        
-        if "Phishing" in playbook_name:
-            ambiguous_steps.append("Step 3: 'Analyze email headers' assumes technical expertise")
-            missing_elements.append("Missing user communication templates")
-            recommendations.append("Include step-by-step header analysis guide with examples")
-            clarity_score -= 0.10
-        
-        if "Data Breach" in playbook_name:
-            unrealistic_assumptions.append("Assumes full network visibility and logging")
-            missing_elements.append("Legal and regulatory notification procedures undefined")
-            recommendations.append("Develop breach notification checklist with timelines")
-            feasibility_score -= 0.15
-            completeness_score -= 0.12
+        lowered = playbook_name.lower()
+        for adjustment in self.ADJUSTMENTS:
+            if not any(keyword in lowered for keyword in adjustment['keywords']):
+                continue
+            ambiguous_steps.extend(adjustment['ambiguous_steps'])
+            missing_elements.extend(adjustment['missing_elements'])
+            unrealistic_assumptions.extend(adjustment['unrealistic_assumptions'])
+            recommendations.extend(adjustment['recommendations'])
+            clarity_score += adjustment['clarity']
+            feasibility_score += adjustment['feasibility']
+            completeness_score += adjustment['completeness']
         
         # Common gaps across all playbooks
         if not missing_elements:
@@ -527,49 +694,40 @@ class PlaybookModule:
     
     def _display_evaluation_results(self):
         """Display playbook evaluation results"""
-        print(f"\n{Color.BOLD}Playbook Evaluation Results:{Color.RESET}\n")
+        BOLD, RESET, RED, YELLOW = Color.BOLD, Color.RESET, Color.RED, Color.YELLOW
+        lines = [f"\n{BOLD}Playbook Evaluation Results:{RESET}\n"]
         
         for result in self.results:
             overall = (result.clarity_score + result.feasibility_score + result.completeness_score) / 3
             
-            print(f"{Color.BOLD}{result.playbook_name}{Color.RESET}")
-            print(f"  Overall Effectiveness: {self._score_to_color(overall)}")
-            print(f"  Clarity: {self._score_to_color(result.clarity_score)}")
-            print(f"  Feasibility: {self._score_to_color(result.feasibility_score)}")
-            print(f"  Completeness: {self._score_to_color(result.completeness_score)}")
+            lines.append(f"{BOLD}{result.playbook_name}{RESET}")
+            lines.append(f"  Overall Effectiveness: {score_to_color(overall, self.SCORE_THRESHOLDS)}")
+            lines.append(f"  Clarity: {score_to_color(result.clarity_score, self.SCORE_THRESHOLDS)}")
+            lines.append(f"  Feasibility: {score_to_color(result.feasibility_score, self.SCORE_THRESHOLDS)}")
+            lines.append(f"  Completeness: {score_to_color(result.completeness_score, self.SCORE_THRESHOLDS)}")
             
             if result.ambiguous_steps:
-                print(f"  {Color.YELLOW}Ambiguous Steps:{Color.RESET}")
-                for step in result.ambiguous_steps[:2]:  # Limit display
-                    print(f"    • {step}")
+                lines.append(f"  {YELLOW}Ambiguous Steps:{RESET}")
+                lines.extend(f"    • {step}" for step in result.ambiguous_steps[:2])  # Limit display
             
             if result.missing_elements:
-                print(f"  {Color.RED}Missing Elements:{Color.RESET}")
-                for element in result.missing_elements[:2]:
-                    print(f"    • {element}")
-            print()
-    
-    def _score_to_color(self, score: float) -> str:
-        """Convert score to colored display"""
-        percentage = int(score * 100)
-        if score >= 0.8:
-            color = Color.GREEN
-        elif score >= 0.65:
-            color = Color.YELLOW
-        else:
-            color = Color.RED
-        return f"{color}{percentage}%{Color.RESET}"
+                lines.append(f"  {RED}Missing Elements:{RESET}")
+                lines.extend(f"    • {element}" for element in result.missing_elements[:2])
+            lines.append("")
+        
+        print_lines(lines)
     
+    @memoize_on_results
     def get_playbook_effectiveness_score(self) -> float:
         """Calculate overall playbook effectiveness"""
         if not self.results:
             return 0.0
         
-        scores = [
+        total = sum(
             (r.clarity_score + r.feasibility_score + r.completeness_score) / 3
             for r in self.results
-        ]
-        return sum(scores) / len(scores)
+        )
+        return total / len(self.results)
 
 
 # ============================================================================
@@ -579,6 +737,8 @@ class PlaybookModule:
 class PolicyToolModule:
     """Module for evaluating security policies and tool readiness"""
     
+    SCORE_THRESHOLDS = (0.8, 0.65)
+    
     def __init__(self, environment: EnvironmentModule):
         self.environment = environment
         self.policy_score = 0.0
@@ -619,11 +779,12 @@ class PolicyToolModule:
         ]
         
         policy_scores = []
+        suffix = _YES_NO_SUFFIXES[True]
         for policy_name, description in policies:
-            exists = get_yes_no(f"  {policy_name} exists and is current")
+            exists = get_yes_no(f"  {policy_name} exists and is current", prompt_suffix=suffix)
             if exists:
-                documented = get_yes_no(f"    Is it well-documented and accessible")
-                tested = get_yes_no(f"    Has it been tested in the last 12 months")
+                documented = get_yes_no("    Is it well-documented and accessible", prompt_suffix=suffix)
+                tested = get_yes_no("    Has it been tested in the last 12 months", prompt_suffix=suffix)
                 
                 score = 0.5 + (0.25 if documented else 0) + (0.25 if tested else 0)
                 policy_scores.append(score)
@@ -647,12 +808,13 @@ class PolicyToolModule:
         
         tools = self.environment.profile.security_tools
         tool_scores = []
+        suffix = _YES_NO_SUFFIXES[True]
         
         for tool in tools:
             print(f"{Color.BOLD}{tool}:{Color.RESET}")
             
-            operational = get_yes_no(f"  Fully operational and monitored")
-            integrated = get_yes_no(f"  Integrated with incident response workflow")
+            operational = get_yes_no("  Fully operational and monitored", prompt_suffix=suffix)
+            integrated = get_yes_no("  Integrated with incident response workflow", prompt_suffix=suffix)
             
             score = 0.5 if operational else 0.0
             score += 0.3 if integrated else 0.0
@@ -670,53 +832,40 @@ class PolicyToolModule:
         """Identify potential response bottlenecks"""
         print(f"{Color.BOLD}Bottleneck Analysis:{Color.RESET}\n")
         
-        potential_bottlenecks = [
-            ("Manual log correlation", "Requires manual analysis across multiple systems"),
-            ("Approval delays", "Critical actions require management approval"),
-            ("Tool fragmentation", "No unified incident management platform"),
-            ("Expertise gaps", "Limited 24/7 coverage or specialized skills"),
-            ("Communication delays", "Stakeholder notification requires manual coordination")
-        ]
+        potential_bottlenecks = (
+            ("Manual log correlation", "Requires manual analysis across multiple systems",
+             "Implement SOAR platform for automated log correlation"),
+            ("Approval delays", "Critical actions require management approval",
+             "Pre-authorize common response actions for on-call personnel"),
+            ("Tool fragmentation", "No unified incident management platform",
+             "Deploy unified SIEM/SOAR platform"),
+            ("Expertise gaps", "Limited 24/7 coverage or specialized skills",
+             "Establish 24/7 SOC coverage or engage MDR provider"),
+            ("Communication delays", "Stakeholder notification requires manual coordination",
+             "Implement automated stakeholder notification system"),
+        )
         
-        for bottleneck, description in potential_bottlenecks:
-            if get_yes_no(f"  Potential bottleneck: {bottleneck}"):
+        suffix = _YES_NO_SUFFIXES[True]
+        for bottleneck, description, recommendation in potential_bottlenecks:
+            if get_yes_no(f"  Potential bottleneck: {bottleneck}", prompt_suffix=suffix):
                 self.bottlenecks.append(f"{bottleneck}: {description}")
-                
-                # Generate specific recommendations
-                if "Manual log" in bottleneck:
-                    self.recommendations.append("Implement SOAR platform for automated log correlation")
-                elif "Approval" in bottleneck:
-                    self.recommendations.append("Pre-authorize common response actions for on-call personnel")
-                elif "Tool fragmentation" in bottleneck:
-                    self.recommendations.append("Deploy unified SIEM/SOAR platform")
-                elif "Expertise" in bottleneck:
-                    self.recommendations.append("Establish 24/7 SOC coverage or engage MDR provider")
-                elif "Communication" in bottleneck:
-                    self.recommendations.append("Implement automated stakeholder notification system")
+                self.recommendations.append(recommendation)
         print()
     
     def _display_results(self):
         """Display policy and tool readiness results"""
-        print(f"\n{Color.BOLD}Policy & Tool Readiness Summary:{Color.RESET}\n")
-        
-        print(f"Policy Maturity: {self._score_to_color(self.policy_score)}")
-        print(f"Tool Effectiveness: {self._score_to_color(self.tool_score)}")
+        BOLD, RESET, YELLOW = Color.BOLD, Color.RESET, Color.YELLOW
+        lines = [
+            f"\n{BOLD}Policy & Tool Readiness Summary:{RESET}\n",
+            f"Policy Maturity: {score_to_color(self.policy_score, self.SCORE_THRESHOLDS)}",
+            f"Tool Effectiveness: {score_to_color(self.tool_score, self.SCORE_THRESHOLDS)}",
+        ]
         
         if self.bottlenecks:
-            print(f"\n{Color.YELLOW}Identified Bottlenecks:{Color.RESET}")
-            for bottleneck in self.bottlenecks:
-                print(f"  • {bottleneck}")
-    
-    def _score_to_color(self, score: float) -> str:
-        """Convert score to colored display"""
-        percentage = int(score * 100)
-        if score >= 0.8:
-            color = Color.GREEN
-        elif score >= 0.65:
-            color = Color.YELLOW
-        else:
-            color = Color.RED
-        return f"{color}{percentage}%{Color.RESET}"
+            lines.append(f"\n{YELLOW}Identified Bottlenecks:{RESET}")
+            lines.extend(f"  • {bottleneck}" for bottleneck in self.bottlenecks)
+        
+        print_lines(lines)
     
     def get_policy_alignment_score(self) -> float:
         """Get overall policy alignment score"""
@@ -730,6 +879,14 @@ class PolicyToolModule:
 class ScenarioModule:
     """Module for scenario-based readiness testing"""
     
+    SCORE_THRESHOLDS = (0.8, 0.65)
+    
+    # Readiness weights for log availability, playbook match and timeline feasibility
+    READINESS_WEIGHTS = (0.4, 0.3, 0.3)
+    
+    # Lowercased scenario log/playbook names, shared by every scenario run
+    _LOWER_CACHE: Dict[str, str] = {}
+    
     def __init__(self, environment: EnvironmentModule, log_module: LogAnalysisModule, 
                  playbook_module: PlaybookModule, policy_module: PolicyToolModule):
         self.environment = environment
@@ -737,6 +894,10 @@ class ScenarioModule:
         self.playbook_module = playbook_module
         self.policy_module = policy_module
         self.scenarios: List[Dict[str, Any]] = []
+        self.average_readiness = 0.0
+        self._available_logs_set = frozenset()
+        self._available_logs_index = ""
+        self._playbook_names_index = ""
     
     def run_scenario_testing(self) -> List[Dict[str, Any]]:
         """Run scenario-based readiness evaluation"""
@@ -782,14 +943,30 @@ class ScenarioModule:
         if selected.lower() == 'all':
             scenarios_to_test = predefined_scenarios
         else:
-            indices = [int(x.strip()) - 1 for x in selected.split(',') if x.strip().isdigit()]
+            indices = [int(x) - 1 for x in parse_csv(selected) if x.isdigit()]
             scenarios_to_test = [predefined_scenarios[i] for i in indices if 0 <= i < len(predefined_scenarios)]
         
+        # Index available log names once for all scenarios: exact names go in
+        # a set, and a newline-joined lowercase string lets each remaining
+        # required log be matched with a single substring search (log names
+        # never contain newlines)
+        available_lower = [r.source_name.lower() for r in self.log_module.results if r.available]
+        self._available_logs_set = frozenset(available_lower)
+        self._available_logs_index = "\n".join(available_lower)
+        self._playbook_names_index = "\n".join(
+            p.playbook_name.lower() for p in self.playbook_module.results
+        )
+        
         for i, scenario in enumerate(scenarios_to_test, 1):
             display_progress_bar(i, len(scenarios_to_test), "Testing")
             result = self._test_scenario(scenario)
             self.scenarios.append(result)
         
+        self.average_readiness = (
+            sum(s['readiness_score'] for s in self.scenarios) / len(self.scenarios)
+            if self.scenarios else 0.0
+        )
+        
         print("\n")
         self._display_scenario_results()
         
@@ -808,77 +985,87 @@ class ScenarioModule:
             'strengths': []
         }
         
+        # Nothing to test against, skip scoring entirely
+        if not scenario.get('required_logs') and not scenario.get('required_playbook'):
+            result['gaps'].append("Scenario defines no required logs or playbook")
+            return result
+        
         # Check log availability
-        available_logs = [r.source_name for r in self.log_module.results if r.available]
         required_logs = scenario['required_logs']
-        
-        log_coverage = sum(1 for log in required_logs if any(log.lower() in al.lower() for al in available_logs))
+        missing_logs = [log for log in required_logs if not self._has_available_log(log)]
+        log_coverage = len(required_logs) - len(missing_logs)
         result['log_availability'] = log_coverage / len(required_logs) if required_logs else 0.0
         
         if result['log_availability'] < 1.0:
-            missing_logs = [log for log in required_logs if not any(log.lower() in al.lower() for al in available_logs)]
             result['gaps'].append(f"Missing critical logs: {', '.join(missing_logs)}")
         else:
             result['strengths'].append("All required log sources available")
         
         # Check playbook availability
-        playbook_names = [p.playbook_name for p in self.playbook_module.results]
-        result['playbook_match'] = any(scenario['required_playbook'].lower() in pb.lower() for pb in playbook_names)
+        playbook_names = self._playbook_names_index
+        result['playbook_match'] = bool(playbook_names) and self._lower(scenario['required_playbook']) in playbook_names
         
         if not result['playbook_match']:
             result['gaps'].append(f"No playbook for {scenario['required_playbook']}")
         else:
             result['strengths'].append(f"Relevant playbook exists: {scenario['required_playbook']}")
         
-        # Estimate timeline reconstruction feasibility
-        if result['log_availability'] >= 0.8 and result['playbook_match']:
+        # Estimate timeline reconstruction feasibility (poor log coverage
+        # settles it regardless of playbook match)
+        if result['log_availability'] < 0.6:
+            result['timeline_feasibility'] = 0.40
+        elif result['log_availability'] >= 0.8 and result['playbook_match']:
             result['timeline_feasibility'] = 0.85
-        elif result['log_availability'] >= 0.6:
-            result['timeline_feasibility'] = 0.65
         else:
-            result['timeline_feasibility'] = 0.40
+            result['timeline_feasibility'] = 0.65
         
         # Calculate overall readiness
+        log_weight, playbook_weight, timeline_weight = self.READINESS_WEIGHTS
         result['readiness_score'] = (
-            result['log_availability'] * 0.4 +
-            (1.0 if result['playbook_match'] else 0.0) * 0.3 +
-            result['timeline_feasibility'] * 0.3
+            result['log_availability'] * log_weight +
+            (playbook_weight if result['playbook_match'] else 0.0) +
+            result['timeline_feasibility'] * timeline_weight
         )
         
         return result
     
+    @classmethod
+    def _lower(cls, text: str) -> str:
+        """Lowercase a scenario name, reusing the cached string when seen before"""
+        lowered = cls._LOWER_CACHE.get(text)
+        if lowered is None:
+            lowered = cls._LOWER_CACHE[text] = text.lower()
+        return lowered
+    
+    def _has_available_log(self, log: str) -> bool:
+        """Check whether a required log is covered by an available source"""
+        name = self._lower(log)
+        if name in self._available_logs_set:
+            return True
+        return bool(self._available_logs_index) and name in self._available_logs_index
+    
     def _display_scenario_results(self):
         """Display scenario testing results"""
-        print(f"{Color.BOLD}Scenario Testing Results:{Color.RESET}\n")
+        BOLD, DIM, RESET, RED, GREEN = Color.BOLD, Color.DIM, Color.RESET, Color.RED, Color.GREEN
+        lines = [f"{BOLD}Scenario Testing Results:{RESET}\n"]
         
         for scenario in self.scenarios:
-            print(f"{Color.BOLD}{scenario['name']}{Color.RESET}")
-            print(f"  {Color.DIM}{scenario['description']}{Color.RESET}")
-            print(f"  Readiness Score: {self._score_to_color(scenario['readiness_score'])}")
-            print(f"  Log Availability: {self._score_to_color(scenario['log_availability'])}")
-            print(f"  Timeline Feasibility: {self._score_to_color(scenario['timeline_feasibility'])}")
+            lines.append(f"{BOLD}{scenario['name']}{RESET}")
+            lines.append(f"  {DIM}{scenario['description']}{RESET}")
+            lines.append(f"  Readiness Score: {score_to_color(scenario['readiness_score'], self.SCORE_THRESHOLDS)}")
+            lines.append(f"  Log Availability: {score_to_color(scenario['log_availability'], self.SCORE_THRESHOLDS)}")
+            lines.append(f"  Timeline Feasibility: {score_to_color(scenario['timeline_feasibility'], self.SCORE_THRESHOLDS)}")
             
             if scenario['strengths']:
-                print(f"  {Color.GREEN}Strengths:{Color.RESET}")
-                for strength in scenario['strengths']:
-                    print(f"    • {strength}")
+                lines.append(f"  {GREEN}Strengths:{RESET}")
+                lines.extend(f"    • {strength}" for strength in scenario['strengths'])
             
             if scenario['gaps']:
-                print(f"  {Color.RED}Gaps:{Color.RESET}")
-                for gap in scenario['gaps']:
-                    print(f"    • {gap}")
-            print()
-    
-    def _score_to_color(self, score: float) -> str:
-        """Convert score to colored display"""
-        percentage = int(score * 100)
-        if score >= 0.8:
-            color = Color.GREEN
-        elif score >= 0.65:
-            color = Color.YELLOW
-        else:
-            color = Color.RED
-        return f"{color}{percentage}%{Color.RESET}"
+                lines.append(f"  {RED}Gaps:{RESET}")
+                lines.extend(f"    • {gap}" for gap in scenario['gaps'])
+            lines.append("")
+        
+        print_lines(lines)
 
 
 # ============================================================================
@@ -888,6 +1075,51 @@ class ScenarioModule:
 class AssessmentModule:
     """Module for generating comprehensive readiness assessment"""
     
+    SCORE_THRESHOLDS = (0.85, 0.75)
+    
+    # Lower score bound for each readiness level above CRITICAL, ascending
+    LEVEL_THRESHOLDS = (0.40, 0.60, 0.75, 0.85)
+    LEVELS = (
+        ReadinessLevel.CRITICAL,
+        ReadinessLevel.LOW,
+        ReadinessLevel.MODERATE,
+        ReadinessLevel.HIGH,
+        ReadinessLevel.EXCELLENT,
+    )
+    
+    # (metric, threshold, recommendations) - added when the metric falls below threshold
+    RECOMMENDATION_RULES = (
+        ('evidence', 0.75, (
+            "Implement comprehensive logging across all critical systems",
+            "Deploy centralized log management (SIEM) platform",
+        )),
+        ('retention_days', 90, (
+            "Extend log retention to minimum 90 days (180 days recommended)",
+        )),
+        ('playbook', 0.70, (
+            "Conduct comprehensive playbook review and update cycle",
+            "Schedule quarterly tabletop exercises to validate procedures",
+        )),
+        ('policy', 0.70, (
+            "Formalize incident response policies and procedures",
+            "Establish clear escalation paths and approval thresholds",
+        )),
+        ('tool', 0.75, (
+            "Integrate security tools into unified incident response platform",
+            "Implement SOAR capabilities for automated response actions",
+        )),
+        ('timeline', 0.70, (
+            "Improve log correlation and timestamp synchronization",
+            "Deploy network traffic analysis (NTA) for comprehensive visibility",
+        )),
+    )
+    
+    GENERAL_RECOMMENDATIONS = (
+        "Establish 24/7 SOC coverage or engage MDR provider",
+        "Conduct annual incident response capability assessment",
+        "Develop incident response metrics and KPIs",
+    )
+    
     def __init__(self, environment: EnvironmentModule, log_module: LogAnalysisModule,
                  playbook_module: PlaybookModule, policy_module: PolicyToolModule,
                  scenario_module: ScenarioModule):
@@ -925,10 +1157,10 @@ class AssessmentModule:
         readiness_level = self._determine_readiness_level(overall_score)
         
         # Collect all gaps and prioritize
-        critical_gaps, high_gaps, medium_gaps = self._prioritize_gaps()
+        critical_gaps, high_gaps, medium_gaps = self._prioritize_gaps(evidence_score, playbook_score)
         
         # Generate recommendations
-        recommendations = self._generate_recommendations()
+        recommendations = self._generate_recommendations(evidence_score, playbook_score, timeline_score)
         
         self.assessment = ReadinessAssessment(
             overall_score=overall_score,
@@ -959,38 +1191,31 @@ class AssessmentModule:
     
     def _determine_readiness_level(self, score: float) -> ReadinessLevel:
         """Determine overall readiness level"""
-        if score >= 0.85:
-            return ReadinessLevel.EXCELLENT
-        elif score >= 0.75:
-            return ReadinessLevel.HIGH
-        elif score >= 0.60:
-            return ReadinessLevel.MODERATE
-        elif score >= 0.40:
-            return ReadinessLevel.LOW
-        else:
-            return ReadinessLevel.CRITICAL
+        return self.LEVELS[bisect_right(self.LEVEL_THRESHOLDS, score)]
     
-    def _prioritize_gaps(self) -> tuple:
+    def _prioritize_gaps(self, evidence_score: float, playbook_score: float) -> tuple:
         """Prioritize identified gaps"""
         critical_gaps = []
         high_gaps = []
         medium_gaps = []
         
         # Evidence gaps
-        if self.log_module.get_evidence_availability_score() < 0.60:
+        if evidence_score < 0.60:
             critical_gaps.append("Insufficient log coverage for effective incident investigation")
         
-        for result in self.log_module.results:
-            if not result.retention_compliance:
-                high_gaps.append(f"{result.source_name}: Inadequate retention period")
+        high_gaps.extend(
+            f"{result.source_name}: Inadequate retention period"
+            for result in self.log_module.results if not result.retention_compliance
+        )
         
         # Playbook gaps
-        if self.playbook_module.get_playbook_effectiveness_score() < 0.60:
+        if playbook_score < 0.60:
             critical_gaps.append("Incident response playbooks lack clarity or completeness")
         
-        for result in self.playbook_module.results:
-            if result.unrealistic_assumptions:
-                high_gaps.append(f"{result.playbook_name}: Contains unrealistic assumptions")
+        high_gaps.extend(
+            f"{result.playbook_name}: Contains unrealistic assumptions"
+            for result in self.playbook_module.results if result.unrealistic_assumptions
+        )
         
         # Policy and tool gaps
         if self.policy_module.policy_score < 0.60:
@@ -999,54 +1224,35 @@ class AssessmentModule:
         if self.policy_module.tool_score < 0.70:
             high_gaps.append("Security tools not fully integrated into response workflow")
         
-        for bottleneck in self.policy_module.bottlenecks:
-            medium_gaps.append(bottleneck)
+        medium_gaps.extend(self.policy_module.bottlenecks)
         
         # Scenario-specific gaps
         if self.scenario_module.scenarios:
-            avg_scenario_score = sum(s['readiness_score'] for s in self.scenario_module.scenarios) / len(self.scenario_module.scenarios)
-            if avg_scenario_score < 0.65:
+            if self.scenario_module.average_readiness < 0.65:
                 high_gaps.append("Limited readiness for common incident scenarios")
         
         return critical_gaps, high_gaps, medium_gaps
     
-    def _generate_recommendations(self) -> List[str]:
+    def _generate_recommendations(self, evidence_score: float, playbook_score: float,
+                                  timeline_score: float) -> List[str]:
         """Generate prioritized recommendations"""
-        recommendations = []
-        
-        # Evidence recommendations
-        if self.log_module.get_evidence_availability_score() < 0.75:
-            recommendations.append("Implement comprehensive logging across all critical systems")
-            recommendations.append("Deploy centralized log management (SIEM) platform")
-        
-        if self.environment.profile and self.environment.profile.retention_days < 90:
-            recommendations.append("Extend log retention to minimum 90 days (180 days recommended)")
-        
-        # Playbook recommendations
-        if self.playbook_module.get_playbook_effectiveness_score() < 0.70:
-            recommendations.append("Conduct comprehensive playbook review and update cycle")
-            recommendations.append("Schedule quarterly tabletop exercises to validate procedures")
-        
-        # Policy recommendations
-        if self.policy_module.policy_score < 0.70:
-            recommendations.append("Formalize incident response policies and procedures")
-            recommendations.append("Establish clear escalation paths and approval thresholds")
-        
-        # Tool recommendations
-        if self.policy_module.tool_score < 0.75:
-            recommendations.append("Integrate security tools into unified incident response platform")
-            recommendations.append("Implement SOAR capabilities for automated response actions")
-        
-        # Timeline recommendations
-        timeline_score = self.assessment.timeline_reconstruction if self.assessment else 0.0
-        if timeline_score < 0.70:
-            recommendations.append("Improve log correlation and timestamp synchronization")
-            recommendations.append("Deploy network traffic analysis (NTA) for comprehensive visibility")
-        
-        # General recommendations
-        recommendations.append("Establish 24/7 SOC coverage or engage MDR provider")
-        recommendations.append("Conduct annual incident response capability assessment")
-        recommendations.append("Develop incident response metrics and KPIs")
+        metrics = {
+            'evidence': evidence_score,
+            'playbook': playbook_score,
+            'policy': self.policy_module.policy_score,
+            'tool': self.policy_module.tool_score,
+            'timeline': timeline_score,
+        }
+        if self.environment.profile:
+            metrics['retention_days'] = self.environment.profile.retention_days
+        
+        recommendations = [
+            recommendation
+            for metric, threshold, rule_recommendations in self.RECOMMENDATION_RULES
+            if metric in metrics and metrics[metric] < threshold
+            for recommendation in rule_recommendations
+        ]
+        recommendations.extend(self.GENERAL_RECOMMENDATIONS)
         
         return recommendations[:15]  # Limit to top 15
     
@@ -1055,40 +1261,46 @@ class AssessmentModule:
         if not self.assessment:
             return
         
+        BOLD, RESET, RED, YELLOW, CYAN = Color.BOLD, Color.RESET, Color.RED, Color.YELLOW, Color.CYAN
+        
         # Overall readiness
-        print(f"{Color.BOLD}OVERALL INCIDENT RESPONSE READINESS{Color.RESET}")
-        print(f"{Color.BOLD}{'═'*60}{Color.RESET}\n")
+        lines = [
+            f"{BOLD}OVERALL INCIDENT RESPONSE READINESS{RESET}",
+            f"{BOLD}{'═'*60}{RESET}\n",
+        ]
         
         level_color = self._get_level_color(self.assessment.readiness_level)
-        print(f"{Color.BOLD}Readiness Level:{Color.RESET} {level_color}{self.assessment.readiness_level}{Color.RESET}")
-        print(f"{Color.BOLD}Overall Score:{Color.RESET} {self._score_to_color(self.assessment.overall_score)}\n")
+        lines.append(f"{BOLD}Readiness Level:{RESET} {level_color}{self.assessment.readiness_level}{RESET}")
+        lines.append(f"{BOLD}Overall Score:{RESET} {score_to_color(self.assessment.overall_score, self.SCORE_THRESHOLDS)}\n")
         
         # Component scores
-        print(f"{Color.BOLD}Component Scores:{Color.RESET}")
-        print(f"  Evidence Availability:     {self._score_to_color(self.assessment.evidence_availability)}")
-        print(f"  Timeline Reconstruction:   {self._score_to_color(self.assessment.timeline_reconstruction)}")
-        print(f"  Playbook Effectiveness:    {self._score_to_color(self.assessment.playbook_effectiveness)}")
-        print(f"  Policy Alignment:          {self._score_to_color(self.assessment.policy_alignment)}\n")
+        lines.append(f"{BOLD}Component Scores:{RESET}")
+        lines.append(f"  Evidence Availability:     {score_to_color(self.assessment.evidence_availability, self.SCORE_THRESHOLDS)}")
+        lines.append(f"  Timeline Reconstruction:   {score_to_color(self.assessment.timeline_reconstruction, self.SCORE_THRESHOLDS)}")
+        lines.append(f"  Playbook Effectiveness:    {score_to_color(self.assessment.playbook_effectiveness, self.SCORE_THRESHOLDS)}")
+        lines.append(f"  Policy Alignment:          {score_to_color(self.assessment.policy_alignment, self.SCORE_THRESHOLDS)}\n")
         
         # Critical gaps
         if self.assessment.critical_gaps:
-            print(f"{Color.RED}{Color.BOLD}CRITICAL GAPS:{Color.RESET}")
-            for gap in self.assessment.critical_gaps:
-                print(f"  {Color.RED}⚠{Color.RESET} {gap}")
-            print()
+            lines.append(f"{RED}{BOLD}CRITICAL GAPS:{RESET}")
+            lines.extend(f"  {RED}⚠{RESET} {gap}" for gap in self.assessment.critical_gaps)
+            lines.append("")
         
         # High priority gaps
         if self.assessment.high_priority_gaps:
-            print(f"{Color.YELLOW}{Color.BOLD}HIGH PRIORITY GAPS:{Color.RESET}")
-            for gap in self.assessment.high_priority_gaps[:5]:  # Limit display
-                print(f"  {Color.YELLOW}•{Color.RESET} {gap}")
-            print()
+            lines.append(f"{YELLOW}{BOLD}HIGH PRIORITY GAPS:{RESET}")
+            lines.extend(f"  {YELLOW}•{RESET} {gap}" for gap in self.assessment.high_priority_gaps[:5])  # Limit display
+            lines.append("")
         
         # Top recommendations
-        print(f"{Color.BOLD}TOP RECOMMENDATIONS:{Color.RESET}")
-        for i, rec in enumerate(self.assessment.recommendations[:10], 1):
-            print(f"  {Color.CYAN}{i}.{Color.RESET} {rec}")
-        print()
+        lines.append(f"{BOLD}TOP RECOMMENDATIONS:{RESET}")
+        lines.extend(
+            f"  {CYAN}{i}.{RESET} {rec}"
+            for i, rec in enumerate(self.assessment.recommendations[:10], 1)
+        )
+        lines.append("")
+        
+        print_lines(lines)
     
     def _get_level_color(self, level: str) -> str:
         """Get color for readiness level"""
@@ -1101,38 +1313,51 @@ class AssessmentModule:
         }
         return colors.get(level, Color.WHITE)
     
-    def _score_to_color(self, score: float) -> str:
-        """Convert score to colored display"""
-        percentage = int(score * 100)
-        if score >= 0.85:
-            color = Color.GREEN
-        elif score >= 0.75:
-            color = Color.YELLOW
-        else:
-            color = Color.RED
-        return f"{color}{percentage}%{Color.RESET}"
-    
-    def export_assessment(self, format: str = 'json') -> str:
-        """Export assessment to file"""
+    def export_assessment(self, format: str = 'json', compact: bool = False) -> str:
+        """Export assessment to file (compact drops JSON indentation)"""
         if not self.assessment:
             print_error("No assessment available to export")
             return ""
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # Serializers are imported on demand to keep startup fast
         if format.lower() == 'json':
             filename = f"irr_assessment_{timestamp}.json"
-            data = asdict(self.assessment)
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            try:
+                import orjson  # optional, much faster encoder
+            except ImportError:
+                import json
+                data = self._assessment_data()
+                with open(filename, 'w', buffering=_EXPORT_BUFFER_SIZE) as f:
+                    if compact:
+                        json.dump(data, f, separators=(',', ':'))
+                    else:
+                        json.dump(data, f, indent=2)
+            else:
+                # orjson encodes dataclasses natively, no intermediate dict
+                option = 0 if compact else orjson.OPT_INDENT_2
+                with open(filename, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+                    f.write(orjson.dumps(self.assessment, option=option))
         else:
+            import yaml
+            try:
+                from yaml import CSafeDumper as YamlDumper  # libyaml emitter
+            except ImportError:
+                from yaml import SafeDumper as YamlDumper
             filename = f"irr_assessment_{timestamp}.yaml"
-            data = asdict(self.assessment)
-            with open(filename, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False)
+            data = self._assessment_data()
+            with open(filename, 'w', buffering=_EXPORT_BUFFER_SIZE) as f:
+                yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False)
         
         print_success(f"Assessment exported to: {filename}")
         return filename
+    
+    def _assessment_data(self) -> Dict[str, Any]:
+        """Map assessment fields to a dict for serializers without dataclass support"""
+        # Fields are flat (numbers, strings, lists of strings), so a shallow
+        # mapping serializes the same as a recursive asdict()
+        return {f.name: getattr(self.assessment, f.name) for f in fields(self.assessment)}
 
 
 # ============================================================================
@@ -1152,11 +1377,7 @@ class IRRApplication:
     
     def display_consent_screen(self) -> bool:
         """Display consent and overview screen"""
-        clear_screen()
-        print_banner()
-        
-        print(f"{Color.BOLD}OVERVIEW & SCOPE{Color.RESET}")
-        print(f"{Color.DIM}{'─'*60}{Color.RESET}\n")
+        show_banner_screen()
         
         overview_text = """IRR (Incident Readiness & Response Evaluator) is a professional
 assessment platform designed to evaluate your organization's capability
@@ -1178,8 +1399,12 @@ IRR is strictly analytical and does NOT:
 All assessments are performed locally and remain confidential.
 Results can be exported for internal review and improvement planning."""
         
-        print(overview_text)
-        print(f"\n{Color.DIM}{'─'*60}{Color.RESET}\n")
+        print_lines([
+            f"{Color.BOLD}OVERVIEW & SCOPE{Color.RESET}",
+            f"{Color.DIM}{'─'*60}{Color.RESET}\n",
+            overview_text,
+            f"\n{Color.DIM}{'─'*60}{Color.RESET}\n",
+        ])
         
         consent = get_yes_no("Do you consent to proceed with the assessment")
         
@@ -1191,8 +1416,7 @@ Results can be exported for internal review and improvement planning."""
     
     def display_main_menu(self) -> int:
         """Display main application menu"""
-        clear_screen()
-        print_banner()
+        show_banner_screen()
         
         options = [
             "Full Assessment (All Modules)",
@@ -1215,32 +1439,32 @@ Results can be exported for internal review and improvement planning."""
         # Step 1: Environment
         if not self.environment.profile:
             self.environment.collect_environment_data()
-            input(f"\n{Color.DIM}Press Enter to continue...{Color.RESET}")
+            pause()
         
         # Step 2: Log Analysis
         self.log_analysis.analyze_logs()
-        input(f"\n{Color.DIM}Press Enter to continue...{Color.RESET}")
+        pause()
         
         # Step 3: Playbook Evaluation
         self.playbook.evaluate_playbooks()
-        input(f"\n{Color.DIM}Press Enter to continue...{Color.RESET}")
+        pause()
         
         # Step 4: Policy & Tools
         self.policy_tool.evaluate_readiness()
-        input(f"\n{Color.DIM}Press Enter to continue...{Color.RESET}")
+        pause()
         
         # Step 5: Scenarios (optional)
         self.scenario = ScenarioModule(self.environment, self.log_analysis, 
                                       self.playbook, self.policy_tool)
         self.scenario.run_scenario_testing()
-        input(f"\n{Color.DIM}Press Enter to continue...{Color.RESET}")
+        pause()
         
         # Step 6: Generate Assessment
         self.assessment = AssessmentModule(self.environment, self.log_analysis,
                                           self.playbook, self.policy_tool, self.scenario)
         self.assessment.generate_assessment()
         
-        input(f"\n{Color.DIM}Press Enter to return to main menu...{Color.RESET}")
+        pause("Press Enter to return to main menu...")
     
     def run_individual_module(self, choice: int):
         """Run individual assessment module"""
@@ -1306,7 +1530,7 @@ Results can be exported for internal review and improvement planning."""
             format_type = "json" if format_choice == 1 else "yaml"
             self.assessment.export_assessment(format_type)
         
-        input(f"\n{Color.DIM}Press Enter to return to main menu...{Color.RESET}")
+        pause("Press Enter to return to main menu...")
     
     def run(self):
         """Main application loop"""
@@ -1317,8 +1541,7 @@ Results can be exported for internal review and improvement planning."""
             choice = self.display_main_menu()
             
             if choice == 0:
-                clear_screen()
-                print_banner()
+                show_banner_screen()
                 print(f"{Color.CYAN}Thank you for using IRR.{Color.RESET}")
                 print(f"{Color.DIM}Assessment complete. Stay secure.{Color.RESET}\n")
                 break